@@ -11,6 +11,50 @@ struct GPXTrackPoint: Sendable {
 /// GPX 트랙 세그먼트 (연속된 점들의 집합)
 struct GPXSegment: Sendable {
     let points: [CLLocationCoordinate2D]
+
+    /// 지도에 그릴 좌표. 정지 중 기록된 점처럼 직전 점과 거의 같은 위치의 점은 뺍니다.
+    /// 이런 점은 선 모양을 바꾸지 않고 지도에 넘기는 좌표 수만 늘립니다.
+    let displayPoints: [CLLocationCoordinate2D]
+
+    init(points: [CLLocationCoordinate2D]) {
+        self.points = points
+        self.displayPoints = Self.thinned(points)
+    }
+
+    /// 표시할 때 생략할 직전 점과의 최대 거리 (미터)
+    private static let displayToleranceMeters = 1.0
+
+    /// 생략할 점이 없으면 `points`를 그대로 반환하여 저장 공간을 공유합니다.
+    private static func thinned(_ points: [CLLocationCoordinate2D]) -> [CLLocationCoordinate2D] {
+        guard points.count > 2 else { return points }
+
+        let toleranceSquared = displayToleranceMeters * displayToleranceMeters
+        var result: [CLLocationCoordinate2D]?  // 처음 생략할 점을 만났을 때만 만듦
+        var lastKept = points[0]
+        for i in 1..<(points.count - 1) {
+            let point = points[i]
+            if distanceSquared(lastKept, point) < toleranceSquared {
+                if result == nil {
+                    result = Array(points[..<i])
+                }
+                continue
+            }
+            result?.append(point)
+            lastKept = point
+        }
+
+        guard var result else { return points }
+        result.append(points[points.count - 1])  // 선의 끝은 항상 유지
+        return result
+    }
+
+    /// 두 점 사이 거리의 제곱 (미터², 등장방형 근사 — 짧은 거리에서 충분히 정확)
+    private static func distanceSquared(_ a: CLLocationCoordinate2D, _ b: CLLocationCoordinate2D) -> Double {
+        let metersPerDegree = 111_320.0
+        let dy = (b.latitude - a.latitude) * metersPerDegree
+        let dx = (b.longitude - a.longitude) * metersPerDegree * cos(a.latitude * .pi / 180)
+        return dx * dx + dy * dy
+    }
 }
 
 /// GPX 파일 하나에서 파싱된 데이터
@@ -21,3 +65,79 @@ struct GPXFile: Identifiable, Sendable {
     let segments: [GPXSegment]
     let trackPoints: [GPXTrackPoint]
 }
+
+/// 보간용 트랙포인트 묶음.
+///
+/// 시간순 정렬된 트랙포인트를 필드별 배열(시각, 위도, 경도, 고도)로 보관하여
+/// 보간 시 필요한 값만 연속된 메모리에서 읽습니다.
+struct GPXTimeline: Sendable {
+    /// 시각 (timeIntervalSinceReferenceDate), 오름차순
+    let times: [TimeInterval]
+    let latitudes: [Double]
+    let longitudes: [Double]
+    let elevations: [Double]
+
+    /// - Parameter points: 시간순 정렬된 트랙포인트 배열
+    init(points: [GPXTrackPoint]) {
+        self.times = points.map { $0.time.timeIntervalSinceReferenceDate }
+        self.latitudes = points.map { $0.coordinate.latitude }
+        self.longitudes = points.map { $0.coordinate.longitude }
+        self.elevations = points.map { $0.elevation }
+    }
+
+    private init(times: [TimeInterval], latitudes: [Double], longitudes: [Double], elevations: [Double]) {
+        self.times = times
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.elevations = elevations
+    }
+
+    static let empty = GPXTimeline(points: [])
+
+    var isEmpty: Bool { times.isEmpty }
+    var count: Int { times.count }
+
+    /// `index`번째 점의 좌표
+    func coordinate(at index: Int) -> CLLocationCoordinate2D {
+        CLLocationCoordinate2D(latitude: latitudes[index], longitude: longitudes[index])
+    }
+
+    /// 시간순 정렬된 트랙포인트를 병합한 새 타임라인을 반환합니다.
+    /// 두 배열이 이미 정렬되어 있으므로 전체를 다시 정렬하지 않고 한 번에 병합합니다.
+    func merging(_ newPoints: [GPXTrackPoint]) -> GPXTimeline {
+        let other = GPXTimeline(points: newPoints)
+        guard !isEmpty else { return other }
+        guard !other.isEmpty else { return self }
+
+        let total = count + other.count
+        var times: [TimeInterval] = []
+        var latitudes: [Double] = []
+        var longitudes: [Double] = []
+        var elevations: [Double] = []
+        times.reserveCapacity(total)
+        latitudes.reserveCapacity(total)
+        longitudes.reserveCapacity(total)
+        elevations.reserveCapacity(total)
+
+        var i = 0
+        var j = 0
+        while i < count || j < other.count {
+            let source: GPXTimeline
+            let k: Int
+            if j >= other.count || (i < count && self.times[i] <= other.times[j]) {
+                source = self
+                k = i
+                i += 1
+            } else {
+                source = other
+                k = j
+                j += 1
+            }
+            times.append(source.times[k])
+            latitudes.append(source.latitudes[k])
+            longitudes.append(source.longitudes[k])
+            elevations.append(source.elevations[k])
+        }
+        return GPXTimeline(times: times, latitudes: latitudes, longitudes: longitudes, elevations: elevations)
+    }
+}
@@ -8,7 +8,7 @@ final class GPXParser: NSObject, XMLParserDelegate, @unchecked Sendable {
 
     /// GPX 파일 하나를 파싱합니다.
     static func parse(url: URL) throws -> GPXFile {
-        let data = try Data(contentsOf: url)
+        let data = try Data(contentsOf: url, options: .mappedIfSafe)
         let parser = GPXParser()
         parser.fileURL = url
         let xmlParser = XMLParser(data: data)
@@ -19,13 +19,30 @@ final class GPXParser: NSObject, XMLParserDelegate, @unchecked Sendable {
         return parser.buildResult()
     }
 
+    /// 파일 수정 시각이 그대로면 이전 파싱 결과를 재사용하고, 아니면 새로 파싱합니다.
+    /// 재사용할 때도 새 `GPXFile`(새 id)을 반환하므로 목록에서 항목이 겹치지 않습니다.
+    static func parseCached(url: URL) throws -> GPXFile {
+        let key = url.standardizedFileURL
+        let modified = try? key.resourceValues(forKeys: [.contentModificationDateKey]).contentModificationDate
+
+        if let modified, let cached = cachedFile(for: key, modified: modified) {
+            return GPXFile(url: url, name: cached.name, segments: cached.segments, trackPoints: cached.trackPoints)
+        }
+
+        let file = try parse(url: url)
+        if let modified {
+            storeInCache(file, for: key, modified: modified)
+        }
+        return file
+    }
+
     /// 여러 GPX 파일을 파싱하고, 모든 트랙포인트를 시간순으로 정렬하여 반환합니다.
     static func parseFiles(urls: [URL]) -> (files: [GPXFile], allPoints: [GPXTrackPoint]) {
         var files: [GPXFile] = []
         var allPoints: [GPXTrackPoint] = []
 
         for url in urls {
-            guard let file = try? parse(url: url) else { continue }
+            guard let file = try? parseCached(url: url) else { continue }
             allPoints.append(contentsOf: file.trackPoints)
             files.append(file)
         }
@@ -34,13 +51,60 @@ final class GPXParser: NSObject, XMLParserDelegate, @unchecked Sendable {
         return (files, allPoints)
     }
 
+    // MARK: - Cache
+
+    /// 캐시에 보관할 트랙포인트 최대 개수. 넘으면 가장 오래 쓰지 않은 파일부터 버립니다.
+    private static let cachePointLimit = 500_000
+
+    /// 파일 수정 시각을 키로 보관하는 파싱 결과 (수정 시각이 바뀌면 자동 무효화)
+    private struct CacheEntry {
+        let modified: Date
+        let file: GPXFile
+        var lastUsed: UInt64
+    }
+
+    nonisolated(unsafe) private static var cache: [URL: CacheEntry] = [:]
+    nonisolated(unsafe) private static var cachedPointCount = 0
+    nonisolated(unsafe) private static var cacheClock: UInt64 = 0
+    private static let cacheLock = NSLock()
+
+    private static func cachedFile(for key: URL, modified: Date) -> GPXFile? {
+        cacheLock.withLock {
+            guard var entry = cache[key], entry.modified == modified else { return nil }
+            cacheClock += 1
+            entry.lastUsed = cacheClock
+            cache[key] = entry
+            return entry.file
+        }
+    }
+
+    private static func storeInCache(_ file: GPXFile, for key: URL, modified: Date) {
+        let pointCount = file.trackPoints.count
+        guard pointCount <= cachePointLimit else { return }
+
+        cacheLock.withLock {
+            if let old = cache.removeValue(forKey: key) {
+                cachedPointCount -= old.file.trackPoints.count
+            }
+            cacheClock += 1
+            cache[key] = CacheEntry(modified: modified, file: file, lastUsed: cacheClock)
+            cachedPointCount += pointCount
+
+            while cachedPointCount > cachePointLimit,
+                  let oldest = cache.min(by: { $0.value.lastUsed < $1.value.lastUsed }) {
+                cache.removeValue(forKey: oldest.key)
+                cachedPointCount -= oldest.value.file.trackPoints.count
+            }
+        }
+    }
+
     // MARK: - Private State
 
     private var fileURL: URL = URL(fileURLWithPath: "/")
 
-    // Parsing state
-    private var currentElement = ""
+    // Parsing state — 텍스트는 필요한 요소(name, ele, time) 안에서만 모읍니다
     private var currentText = ""
+    private var collectingText = false
 
     // Track hierarchy
     private var currentTrackName: String?
@@ -81,7 +145,9 @@ final class GPXParser: NSObject, XMLParserDelegate, @unchecked Sendable {
 
     private func parseDate(_ string: String) -> Date? {
         let trimmed = string.trimmingCharacters(in: .whitespacesAndNewlines)
-        // Try ISO8601DateFormatter first
+        // 일반적인 GPX 시각은 포매터 없이 바로 파싱
+        if let d = TimestampParser.parseISO8601(trimmed) { return d }
+        // Try ISO8601DateFormatter
         if let d = Self.isoFormatter.date(from: trimmed) { return d }
         // Fallback to DateFormatter variants
         for df in Self.dateFormatters {
@@ -108,10 +174,11 @@ final class GPXParser: NSObject, XMLParserDelegate, @unchecked Sendable {
         qualifiedName: String?,
         attributes attributeDict: [String: String]
     ) {
-        currentElement = elementName
-        currentText = ""
-
         switch elementName {
+        case "name", "ele", "time":
+            currentText = ""
+            collectingText = true
+
         case "trkpt", "wpt":
             if let latStr = attributeDict["lat"], let lonStr = attributeDict["lon"],
                let lat = Double(latStr), let lon = Double(lonStr) {
@@ -132,6 +199,7 @@ final class GPXParser: NSObject, XMLParserDelegate, @unchecked Sendable {
     }
 
     func parser(_ parser: XMLParser, foundCharacters string: String) {
+        guard collectingText else { return }
         currentText += string
     }
 
@@ -141,20 +209,21 @@ final class GPXParser: NSObject, XMLParserDelegate, @unchecked Sendable {
         namespaceURI: String?,
         qualifiedName: String?
     ) {
-        let text = currentText.trimmingCharacters(in: .whitespacesAndNewlines)
-
         switch elementName {
         case "name":
+            collectingText = false
             if currentTrackName == nil && !inTrackPoint && !inWaypoint {
-                currentTrackName = text
+                currentTrackName = currentText.trimmingCharacters(in: .whitespacesAndNewlines)
             }
 
         case "ele":
-            currentElevation = Double(text)
+            collectingText = false
+            currentElevation = Double(currentText.trimmingCharacters(in: .whitespacesAndNewlines))
 
         case "time":
+            collectingText = false
             if inTrackPoint || inWaypoint {
-                currentTime = parseDate(text)
+                currentTime = parseDate(currentText)
             }
 
         case "trkpt":
@@ -9,75 +9,61 @@ enum GeotagEngine {
 
     /// 트랙포인트 리스트에서 사진 촬영 시각에 해당하는 GPS 위치를 선형 보간으로 계산합니다.
     ///
-    /// 트랙포인트는 시간순으로 정렬되어 있어야 합니다.
-    ///
     /// - Parameters:
-    ///   - trackPoints: 시간순 정렬된 GPX 트랙포인트 배열
+    ///   - timeline: 시간순 정렬된 GPX 트랙포인트와 시각 배열
     ///   - photoTime: 사진 촬영 시각 (UTC)
     ///   - maxGap: 보간 허용 최대 시간 차이 (초)
     /// - Returns: 보간된 좌표와 고도, 또는 매칭 불가 시 nil
     static func interpolate(
-        trackPoints: [GPXTrackPoint],
+        timeline: GPXTimeline,
         photoTime: Date,
         maxGap: TimeInterval = defaultMaxGapSeconds
     ) -> (coordinate: CLLocationCoordinate2D, altitude: Double)? {
-        guard !trackPoints.isEmpty else { return nil }
+        guard !timeline.isEmpty else { return nil }
 
         // 이진 탐색으로 삽입 위치 찾기
-        let idx = binarySearch(trackPoints: trackPoints, time: photoTime)
-
-        // 정확히 일치
-        if idx < trackPoints.count, trackPoints[idx].time == photoTime {
-            let p = trackPoints[idx]
-            return (p.coordinate, p.elevation)
-        }
-
-        // 범위 밖 (왼쪽)
-        if idx == 0 {
-            let gap = trackPoints[0].time.timeIntervalSince(photoTime)
-            if gap <= maxGap {
-                let p = trackPoints[0]
-                return (p.coordinate, p.elevation)
-            }
-            return nil
-        }
+        let time = photoTime.timeIntervalSinceReferenceDate
+        let idx = binarySearch(times: timeline.times, time: time, in: timeline.times.indices)
+        return interpolate(timeline: timeline, insertionIndex: idx, photoTime: time, maxGap: maxGap)
+    }
 
-        // 범위 밖 (오른쪽)
-        if idx >= trackPoints.count {
-            let gap = photoTime.timeIntervalSince(trackPoints[trackPoints.count - 1].time)
-            if gap <= maxGap {
-                let p = trackPoints[trackPoints.count - 1]
-                return (p.coordinate, p.elevation)
-            }
-            return nil
+    /// 여러 촬영 시각을 한 번에 보간합니다.
+    ///
+    /// 촬영 시각을 정렬된 순서로 처리하면서 트랙 위치를 앞으로만 옮기므로(갤로핑 탐색),
+    /// 사진마다 트랙 전체를 다시 탐색하지 않고 전체 비용이 O(M + N)을 넘지 않습니다.
+    ///
+    /// - Parameter photoTimes: 촬영 시각 배열 (timeIntervalSinceReferenceDate)
+    /// - Returns: 입력 순서와 같은 보간 결과 배열 (매칭 불가 시 nil)
+    static func interpolateBatch(
+        timeline: GPXTimeline,
+        photoTimes: [TimeInterval],
+        maxGap: TimeInterval = defaultMaxGapSeconds
+    ) -> [(coordinate: CLLocationCoordinate2D, altitude: Double)?] {
+        var results: [(coordinate: CLLocationCoordinate2D, altitude: Double)?] =
+            Array(repeating: nil, count: photoTimes.count)
+        guard !timeline.isEmpty else { return results }
+
+        let order = photoTimes.indices.sorted { photoTimes[$0] < photoTimes[$1] }
+        var position = 0
+        for i in order {
+            let time = photoTimes[i]
+            position = gallop(times: timeline.times, time: time, from: position)
+            results[i] = interpolate(
+                timeline: timeline, insertionIndex: position, photoTime: time, maxGap: maxGap
+            )
         }
-
-        // 두 점 사이 보간
-        let before = trackPoints[idx - 1]
-        let after = trackPoints[idx]
-        let totalGap = after.time.timeIntervalSince(before.time)
-
-        if totalGap > maxGap { return nil }
-        if totalGap == 0 { return (before.coordinate, before.elevation) }
-
-        let elapsed = photoTime.timeIntervalSince(before.time)
-        let ratio = elapsed / totalGap
-
-        let lat = before.coordinate.latitude +
-            (after.coordinate.latitude - before.coordinate.latitude) * ratio
-        let lon = before.coordinate.longitude +
-            (after.coordinate.longitude - before.coordinate.longitude) * ratio
-        let alt = before.elevation + (after.elevation - before.elevation) * ratio
-
-        return (CLLocationCoordinate2D(latitude: lat, longitude: lon), alt)
+        return results
     }
 
     /// 여러 사진에 대해 일괄 매칭을 수행합니다.
     static func matchPhotos(
         _ photos: [PhotoItem],
-        trackPoints: [GPXTrackPoint],
+        timeline: GPXTimeline,
         maxGap: TimeInterval = defaultMaxGapSeconds
     ) {
+        var targets: [PhotoItem] = []
+        var photoTimes: [TimeInterval] = []
+
         for photo in photos {
             // 이미 GPS가 있으면 건너뜀
             if photo.originalCoordinate != nil {
@@ -91,8 +77,14 @@ enum GeotagEngine {
                 continue
             }
 
-            // 보간 시도
-            if let result = interpolate(trackPoints: trackPoints, photoTime: dateTaken, maxGap: maxGap) {
+            targets.append(photo)
+            photoTimes.append(dateTaken.timeIntervalSinceReferenceDate)
+        }
+
+        // 보간 시도
+        let results = interpolateBatch(timeline: timeline, photoTimes: photoTimes, maxGap: maxGap)
+        for (photo, result) in zip(targets, results) {
+            if let result {
                 photo.matchedCoordinate = result.coordinate
                 photo.matchedAltitude = result.altitude
                 photo.status = .matched
@@ -102,15 +94,71 @@ enum GeotagEngine {
         }
     }
 
+    // MARK: - 보간
+
+    /// 삽입 위치가 주어졌을 때 앞뒤 트랙포인트로 선형 보간합니다.
+    private static func interpolate(
+        timeline: GPXTimeline,
+        insertionIndex idx: Int,
+        photoTime: TimeInterval,
+        maxGap: TimeInterval
+    ) -> (coordinate: CLLocationCoordinate2D, altitude: Double)? {
+        let times = timeline.times
+
+        // 정확히 일치
+        if idx < times.count, times[idx] == photoTime {
+            return (timeline.coordinate(at: idx), timeline.elevations[idx])
+        }
+
+        // 범위 밖 (왼쪽)
+        if idx == 0 {
+            let gap = times[0] - photoTime
+            if gap <= maxGap {
+                return (timeline.coordinate(at: 0), timeline.elevations[0])
+            }
+            return nil
+        }
+
+        // 범위 밖 (오른쪽)
+        if idx >= times.count {
+            let last = times.count - 1
+            let gap = photoTime - times[last]
+            if gap <= maxGap {
+                return (timeline.coordinate(at: last), timeline.elevations[last])
+            }
+            return nil
+        }
+
+        // 두 점 사이 보간
+        let before = idx - 1
+        let after = idx
+        let totalGap = times[after] - times[before]
+
+        if totalGap > maxGap { return nil }
+        if totalGap == 0 { return (timeline.coordinate(at: before), timeline.elevations[before]) }
+
+        let elapsed = photoTime - times[before]
+        let ratio = elapsed / totalGap
+
+        let lats = timeline.latitudes
+        let lons = timeline.longitudes
+        let eles = timeline.elevations
+        let lat = lats[before] + (lats[after] - lats[before]) * ratio
+        let lon = lons[before] + (lons[after] - lons[before]) * ratio
+        let alt = eles[before] + (eles[after] - eles[before]) * ratio
+
+        return (CLLocationCoordinate2D(latitude: lat, longitude: lon), alt)
+    }
+
     // MARK: - 이진 탐색
 
-    /// 시간순 정렬된 배열에서 삽입 위치를 찾습니다 (bisect_left와 동일)
-    private static func binarySearch(trackPoints: [GPXTrackPoint], time: Date) -> Int {
-        var lo = 0
-        var hi = trackPoints.count
+    /// 시간순 정렬된 배열의 `range` 안에서 삽입 위치를 찾습니다 (bisect_left와 동일)
+    private static func binarySearch(times: [TimeInterval], time: TimeInterval, in range: Range<Int>) -> Int {
+        var lo = range.lowerBound
+        var hi = range.upperBound
         while lo < hi {
             let mid = (lo + hi) / 2
-            if trackPoints[mid].time < time {
+            if times[mid] < time {
                 lo = mid + 1
             } else {
                 hi = mid
@@ -118,4 +166,21 @@ enum GeotagEngine {
         }
         return lo
     }
+
+    /// `start`부터 보폭을 두 배씩 늘리며 앞으로 나아가 삽입 위치가 있는 구간을 찾고, 그 구간만 이진 탐색합니다.
+    /// 비용은 이동한 거리의 로그에 비례하므로, 정렬된 시각을 차례로 찾으면 트랙을 한 번 훑는 것보다 싸게 끝납니다.
+    ///
+    /// - Parameter start: 이전 삽입 위치. 이보다 앞의 점은 모두 `time`보다 이르다고 가정합니다.
+    private static func gallop(times: [TimeInterval], time: TimeInterval, from start: Int) -> Int {
+        guard start < times.count, times[start] < time else { return start }
+
+        // times[known] < time 을 유지하며 전진
+        var known = start
+        var step = 1
+        while known + step < times.count, times[known + step] < time {
+            known += step
+            step *= 2
+        }
+        return binarySearch(times: times, time: time, in: (known + 1)..<min(known + step, times.count))
+    }
 }
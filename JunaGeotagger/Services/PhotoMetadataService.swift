@@ -19,13 +19,21 @@ enum PhotoMetadataService {
 
     // MARK: - 메타데이터 읽기
 
-    struct Metadata {
+    struct Metadata: Sendable {
         var dateTaken: Date?
         var coordinate: CLLocationCoordinate2D?
         var altitude: Double?
         var hasGPS: Bool { coordinate != nil }
     }
 
+    /// 여러 사진의 EXIF 메타데이터를 한 번에 읽습니다.
+    /// 결과 배열은 입력 URL 순서와 같습니다.
+    static func readMetadata(from urls: [URL]) async -> [Metadata] {
+        await concurrentMap(urls, maxConcurrent: maxConcurrentFileOperations) { url in
+            readMetadata(from: url)
+        }
+    }
+
     /// 사진 파일의 EXIF 메타데이터를 읽습니다.
     static func readMetadata(from url: URL) -> Metadata {
         guard let source = CGImageSourceCreateWithURL(url as CFURL, nil) else {
@@ -72,6 +80,26 @@ enum PhotoMetadataService {
 
     // MARK: - GPS 쓰기
 
+    /// GPS 기록 요청 하나
+    struct GPSWrite: Sendable {
+        let url: URL
+        let coordinate: CLLocationCoordinate2D
+        let altitude: Double
+    }
+
+    /// 여러 사진에 GPS 좌표를 한 번에 기록합니다.
+    /// 결과 배열은 입력 순서와 같으며, 각 항목의 성공 여부를 담습니다.
+    ///
+    /// - Parameter progress: 항목 하나를 처리할 때마다 완료 개수와 함께 호출됩니다.
+    static func writeGPS(
+        _ writes: [GPSWrite],
+        progress: (@Sendable (Int) -> Void)? = nil
+    ) async -> [Bool] {
+        await concurrentMap(writes, maxConcurrent: maxConcurrentFileOperations, onCompleted: progress) { w in
+            writeGPS(to: w.url, coordinate: w.coordinate, altitude: w.altitude)
+        }
+    }
+
     /// 사진 파일에 GPS 좌표를 기록합니다.
     /// ImageIO를 사용하여 원본 파일을 직접 수정합니다.
     @discardableResult
@@ -123,35 +151,65 @@ enum PhotoMetadataService {
         }
     }
 
+    // MARK: - 병렬 처리
+
+    /// 파일 읽기·쓰기를 동시에 처리할 최대 개수.
+    /// 4개를 넘기면 디스크 I/O가 병목이 되어 효과가 거의 없고, 느린 외장 디스크에서는 오히려 느려집니다.
+    private static let maxConcurrentFileOperations = min(ProcessInfo.processInfo.activeProcessorCount, 4)
+
+    /// `operation`을 최대 `maxConcurrent`개까지 동시에 실행하고, 입력 순서대로 결과를 반환합니다.
+    ///
+    /// - Parameter onCompleted: 항목 하나가 끝날 때마다 완료 개수와 함께 호출됩니다.
+    private static func concurrentMap<Item: Sendable, Output: Sendable>(
+        _ items: [Item],
+        maxConcurrent: Int,
+        onCompleted: ((Int) -> Void)? = nil,
+        _ operation: @escaping @Sendable (Item) -> Output
+    ) async -> [Output] {
+        var results = [Output?](repeating: nil, count: items.count)
+
+        await withTaskGroup(of: (Int, Output).self) { group in
+            var next = 0
+            while next < min(max(1, maxConcurrent), items.count) {
+                let i = next
+                group.addTask { (i, operation(items[i])) }
+                next += 1
+            }
+
+            var completed = 0
+            for await (i, result) in group {
+                results[i] = result
+                completed += 1
+                onCompleted?(completed)
+
+                // 하나가 끝날 때마다 다음 항목을 투입
+                if next < items.count {
+                    let j = next
+                    group.addTask { (j, operation(items[j])) }
+                    next += 1
+                }
+            }
+        }
+        return results.map { $0! }
+    }
+
     // MARK: - EXIF 날짜 파싱
 
     private static func parseEXIFDate(_ dateStr: String, offsetDict: [CFString: Any]?) -> Date? {
         let trimmed = dateStr.trimmingCharacters(in: .whitespacesAndNewlines)
         guard !trimmed.isEmpty, trimmed != "0000:00:00 00:00:00" else { return nil }
 
-        let formatter = DateFormatter()
-        formatter.locale = Locale(identifier: "en_US_POSIX")
-
-        // "2024:01:15 14:30:00" 형식
-        for fmt in ["yyyy:MM:dd HH:mm:ss", "yyyy-MM-dd HH:mm:ss"] {
-            formatter.dateFormat = fmt
-            formatter.timeZone = TimeZone.current // 기본: 로컬 타임존
-            if let date = formatter.date(from: trimmed) {
-                // Offset 정보가 있으면 적용
-                if let offsetDict = offsetDict,
-                   let offsetStr = (offsetDict[kCGImagePropertyExifOffsetTimeOriginal] as? String)
-                    ?? (offsetDict[kCGImagePropertyExifOffsetTime] as? String) {
-                    if let tz = parseTimezoneOffset(offsetStr) {
-                        formatter.timeZone = tz
-                        if let correctedDate = formatter.date(from: trimmed) {
-                            return correctedDate
-                        }
-                    }
-                }
-                return date
-            }
+        // Offset 정보가 있으면 적용, 없으면 로컬 타임존
+        var timeZone = TimeZone.current
+        if let offsetDict = offsetDict,
+           let offsetStr = (offsetDict[kCGImagePropertyExifOffsetTimeOriginal] as? String)
+            ?? (offsetDict[kCGImagePropertyExifOffsetTime] as? String),
+           let tz = parseTimezoneOffset(offsetStr) {
+            timeZone = tz
         }
-        return nil
+
+        // "2024:01:15 14:30:00" 또는 "2024-01-15 14:30:00" 형식
+        return TimestampParser.parseEXIF(trimmed, timeZone: timeZone)
     }
 
     private static func parseTimezoneOffset(_ offset: String) -> TimeZone? {
@@ -0,0 +1,307 @@
+import AppKit
+import CryptoKit
+import ImageIO
+import QuickLookThumbnailing
+import UniformTypeIdentifiers
+
+/// 사진 목록과 지도 팝오버에 표시할 썸네일을 생성하는 서비스
+enum ThumbnailService {
+
+    /// 스레드 간에 전달하는 썸네일 이미지 (CGImage는 불변이므로 공유해도 안전)
+    struct Thumbnail: @unchecked Sendable {
+        let cgImage: CGImage
+    }
+
+    /// 사진 파일의 썸네일을 생성합니다.
+    ///
+    /// 메모리 캐시와 디스크 캐시를 차례로 확인하고, 없으면 ImageIO 다운샘플링으로 필요한 크기만 디코딩합니다.
+    /// ImageIO가 열지 못하는 파일은 QuickLook 썸네일로 대체합니다.
+    /// 행이 화면에서 사라져 호출한 작업이 취소되면 디코딩을 시작하지 않고 nil을 반환합니다.
+    ///
+    /// - Parameters:
+    ///   - url: 사진 파일 URL
+    ///   - size: 썸네일 한 변의 크기 (포인트)
+    ///   - scale: 화면 배율
+    @MainActor
+    static func thumbnail(for url: URL, size: CGFloat, scale: CGFloat = 2) async -> NSImage? {
+        guard !Task.isCancelled else { return nil }
+        let maxPixelSize = Int(size * scale)
+        let version = await sourceVersion(of: url)
+        let memoryKey = version.map { $0.cacheKey(maxPixelSize: maxPixelSize) as NSString }
+        if let memoryKey, let image = memoryCache.object(forKey: memoryKey) {
+            return image
+        }
+
+        let downsampled = await cachedThumbnail(url: url, version: version, maxPixelSize: maxPixelSize)
+        if downsampled == nil, Task.isCancelled { return nil }
+
+        let image: NSImage
+        let cost: Int
+        if let downsampled {
+            let cgImage = downsampled.cgImage
+            image = NSImage(
+                cgImage: cgImage,
+                size: NSSize(width: CGFloat(cgImage.width) / scale, height: CGFloat(cgImage.height) / scale)
+            )
+            cost = pixelBytes(of: cgImage)
+        } else {
+            let request = QLThumbnailGenerator.Request(
+                fileAt: url,
+                size: CGSize(width: size, height: size),
+                scale: scale,
+                representationTypes: .thumbnail
+            )
+            guard let rep = try? await QLThumbnailGenerator.shared.generateBestRepresentation(for: request) else {
+                return nil
+            }
+            image = rep.nsImage
+            cost = pixelBytes(of: rep.cgImage)
+        }
+
+        if let memoryKey {
+            memoryCache.setObject(image, forKey: memoryKey, cost: cost)
+        }
+        return image
+    }
+
+    // MARK: - 캐시 키
+
+    /// 원본 파일의 표준화된 경로·수정 시각·크기. 메모리 캐시와 디스크 캐시 키가 모두 이 값에서 나오므로,
+    /// 원본이 수정되면 두 캐시 모두 이전 썸네일을 쓰지 않습니다.
+    private struct SourceVersion: Sendable {
+        let path: String
+        let modified: Date
+        let fileSize: Int
+
+        func cacheKey(maxPixelSize: Int) -> String {
+            "\(path):\(modified.timeIntervalSinceReferenceDate):\(fileSize):\(maxPixelSize)"
+        }
+    }
+
+    /// 원본 파일을 한 번만 stat하여 캐시 키에 쓸 값을 읽습니다.
+    /// nonisolated async 함수이므로 메인 스레드 밖에서 실행됩니다.
+    private static func sourceVersion(of url: URL) async -> SourceVersion? {
+        let standardized = url.standardizedFileURL
+        guard let values = try? standardized.resourceValues(forKeys: [.contentModificationDateKey, .fileSizeKey]),
+              let modified = values.contentModificationDate,
+              let fileSize = values.fileSize else { return nil }
+        return SourceVersion(path: standardized.path, modified: modified, fileSize: fileSize)
+    }
+
+    // MARK: - 메모리 캐시
+
+    /// 디코딩이 끝난 썸네일을 보관합니다.
+    /// 목록을 스크롤해 행이 다시 나타날 때 디스크 읽기와 JPEG 디코딩을 건너뜁니다.
+    @MainActor private static let memoryCache: NSCache<NSString, NSImage> = {
+        let cache = NSCache<NSString, NSImage>()
+        cache.totalCostLimit = 64 * 1024 * 1024  // 디코딩된 픽셀 바이트 기준
+        return cache
+    }()
+
+    private static func pixelBytes(of image: CGImage) -> Int {
+        image.bytesPerRow * image.height
+    }
+
+    // MARK: - 디스크 캐시
+
+    /// 썸네일 디스크 캐시 최대 크기 (바이트)
+    private static let diskCacheLimit = 200 * 1024 * 1024
+
+    /// 새 썸네일을 이 개수만큼 저장할 때마다 캐시 크기를 점검합니다.
+    private static let pruneInterval = 100
+
+    private static let cacheDirectory: URL? = {
+        guard let caches = FileManager.default.urls(for: .cachesDirectory, in: .userDomainMask).first else {
+            return nil
+        }
+        let dir = caches
+            .appendingPathComponent(Bundle.main.bundleIdentifier ?? "JunaGeotagger", isDirectory: true)
+            .appendingPathComponent("Thumbnails", isDirectory: true)
+        do {
+            try FileManager.default.createDirectory(at: dir, withIntermediateDirectories: true)
+        } catch {
+            return nil
+        }
+        return dir
+    }()
+
+    nonisolated(unsafe) private static var writesSincePrune = 0
+    nonisolated(unsafe) private static var hasPrunedSinceLaunch = false
+    private static let pruneLock = NSLock()
+
+    /// 디스크 캐시에 있으면 읽고, 없으면 생성해서 저장합니다.
+    /// nonisolated async 함수이므로 메인 스레드 밖에서 실행되고, 호출한 작업의 취소를 이어받습니다.
+    private static func cachedThumbnail(url: URL, version: SourceVersion?, maxPixelSize: Int) async -> Thumbnail? {
+        pruneOnFirstUse()
+        guard let version, let cacheURL = cacheURL(for: version, maxPixelSize: maxPixelSize) else {
+            guard !Task.isCancelled else { return nil }
+            return downsample(url: url, maxPixelSize: maxPixelSize)
+        }
+        if let cached = loadCached(at: cacheURL) {
+            return cached
+        }
+        // 다운샘플링은 비용이 크므로, 그 사이 취소되었으면 건너뜀
+        guard !Task.isCancelled else { return nil }
+        guard let thumbnail = downsample(url: url, maxPixelSize: maxPixelSize) else { return nil }
+        store(thumbnail, at: cacheURL)
+        return thumbnail
+    }
+
+    /// 원본 파일 버전과 썸네일 크기로 캐시 파일 위치를 정합니다.
+    /// (JPEG/PNG 중 어떤 형식으로 저장되든 ImageIO가 내용으로 판별하므로 확장자는 붙이지 않습니다.)
+    private static func cacheURL(for version: SourceVersion, maxPixelSize: Int) -> URL? {
+        guard let dir = cacheDirectory else { return nil }
+        let key = version.cacheKey(maxPixelSize: maxPixelSize)
+        let name = SHA256.hash(data: Data(key.utf8)).prefix(16)
+            .map { String(format: "%02x", $0) }
+            .joined()
+        return dir.appendingPathComponent(name)
+    }
+
+    private static func loadCached(at cacheURL: URL) -> Thumbnail? {
+        guard let source = CGImageSourceCreateWithURL(cacheURL as CFURL, sourceOptions),
+              let image = CGImageSourceCreateImageAtIndex(source, 0, decodeImmediatelyOptions) else { return nil }
+
+        // 오래된 항목부터 정리할 수 있도록 마지막 사용 시각 갱신
+        try? FileManager.default.setAttributes([.modificationDate: Date()], ofItemAtPath: cacheURL.path)
+        return Thumbnail(cgImage: image)
+    }
+
+    private static func store(_ thumbnail: Thumbnail, at cacheURL: URL) {
+        // 임시 파일에 쓰고 rename으로 원자적으로 교체
+        let tempURL = cacheURL.deletingLastPathComponent()
+            .appendingPathComponent(".\(UUID().uuidString).tmp")
+
+        // 투명도가 있는 이미지는 JPEG로 저장하면 투명 영역이 검게 변하므로 PNG로 저장
+        let type: UTType = hasAlpha(thumbnail.cgImage) ? .png : .jpeg
+        guard let destination = CGImageDestinationCreateWithURL(
+            tempURL as CFURL, type.identifier as CFString, 1, nil
+        ) else { return }
+
+        let props: [CFString: Any] = [kCGImageDestinationLossyCompressionQuality: 0.8]
+        CGImageDestinationAddImage(destination, thumbnail.cgImage, props as CFDictionary)
+
+        guard CGImageDestinationFinalize(destination),
+              rename(tempURL.path, cacheURL.path) == 0 else {
+            try? FileManager.default.removeItem(at: tempURL)
+            return
+        }
+
+        pruneIfNeeded()
+    }
+
+    private static func hasAlpha(_ image: CGImage) -> Bool {
+        switch image.alphaInfo {
+        case .none, .noneSkipFirst, .noneSkipLast:
+            return false
+        default:
+            return true
+        }
+    }
+
+    /// 새 썸네일을 `pruneInterval`개 저장할 때마다 캐시 크기를 점검합니다.
+    private static func pruneIfNeeded() {
+        let shouldPrune = pruneLock.withLock {
+            writesSincePrune += 1
+            guard writesSincePrune >= pruneInterval else { return false }
+            writesSincePrune = 0
+            return true
+        }
+        if shouldPrune {
+            prune()
+        }
+    }
+
+    /// 앱 실행 후 캐시를 처음 쓸 때 한 번 크기를 점검합니다.
+    /// 이전 실행에서 한도를 넘긴 캐시도, 새 썸네일을 많이 만들지 않는 세션에서 정리되도록 합니다.
+    private static func pruneOnFirstUse() {
+        let isFirstUse = pruneLock.withLock {
+            defer { hasPrunedSinceLaunch = true }
+            return !hasPrunedSinceLaunch
+        }
+        guard isFirstUse else { return }
+        Task.detached(priority: .utility) {
+            prune()
+        }
+    }
+
+    /// 캐시가 최대 크기를 넘으면 가장 오래 사용하지 않은 썸네일부터 삭제합니다.
+    private static func prune() {
+        guard let dir = cacheDirectory else { return }
+
+        let keys: Set<URLResourceKey> = [.contentModificationDateKey, .totalFileAllocatedSizeKey]
+        guard let files = try? FileManager.default.contentsOfDirectory(
+            at: dir, includingPropertiesForKeys: Array(keys)
+        ) else { return }
+
+        var entries: [(url: URL, lastUsed: Date, size: Int)] = files.compactMap { file in
+            guard let values = try? file.resourceValues(forKeys: keys) else { return nil }
+            return (file, values.contentModificationDate ?? .distantPast, values.totalFileAllocatedSize ?? 0)
+        }
+
+        var totalSize = entries.reduce(0) { $0 + $1.size }
+        guard totalSize > diskCacheLimit else { return }
+
+        entries.sort { $0.lastUsed < $1.lastUsed }
+        for entry in entries where totalSize > diskCacheLimit {
+            if (try? FileManager.default.removeItem(at: entry.url)) != nil {
+                totalSize -= entry.size
+            }
+        }
+    }
+
+    // MARK: - ImageIO
+
+    nonisolated(unsafe) private static let sourceOptions: CFDictionary = [
+        kCGImageSourceShouldCache: false,
+    ] as CFDictionary
+
+    /// 그리는 시점(메인 스레드)이 아니라 생성 시점에 디코딩하도록 하는 옵션
+    nonisolated(unsafe) private static let decodeImmediatelyOptions: CFDictionary = [
+        kCGImageSourceShouldCacheImmediately: true,
+    ] as CFDictionary
+
+    /// 원본 전체를 디코딩하지 않고 최대 픽셀 크기에 맞춰 축소된 이미지를 만듭니다.
+    ///
+    /// HEIC·RAW 등 파일에 충분히 큰 내장 미리보기가 있으면 그것을 먼저 사용하고,
+    /// 없거나 너무 작을 때만 원본 이미지를 디코딩합니다.
+    private static func downsample(url: URL, maxPixelSize: Int) -> Thumbnail? {
+        guard let source = CGImageSourceCreateWithURL(url as CFURL, sourceOptions) else { return nil }
+
+        // 원본이 요청 크기보다 작으면 원본 크기까지만 요구
+        var requiredPixelSize = maxPixelSize
+        if let props = CGImageSourceCopyPropertiesAtIndex(source, 0, sourceOptions) as? [CFString: Any],
+           let width = props[kCGImagePropertyPixelWidth] as? Int,
+           let height = props[kCGImagePropertyPixelHeight] as? Int {
+            requiredPixelSize = min(maxPixelSize, max(width, height))
+        }
+
+        // 내장 미리보기 사용 (없으면 ImageIO가 원본에서 생성)
+        if let embedded = CGImageSourceCreateThumbnailAtIndex(
+            source, 0, thumbnailOptions(maxPixelSize: maxPixelSize, fromImageAlways: false)
+        ), max(embedded.width, embedded.height) >= requiredPixelSize {
+            return Thumbnail(cgImage: embedded)
+        }
+
+        // 내장 미리보기가 너무 작음 — 원본에서 생성
+        guard let image = CGImageSourceCreateThumbnailAtIndex(
+            source, 0, thumbnailOptions(maxPixelSize: maxPixelSize, fromImageAlways: true)
+        ) else {
+            return nil
+        }
+        return Thumbnail(cgImage: image)
+    }
+
+    private static func thumbnailOptions(maxPixelSize: Int, fromImageAlways: Bool) -> CFDictionary {
+        let fromImageKey = fromImageAlways
+            ? kCGImageSourceCreateThumbnailFromImageAlways
+            : kCGImageSourceCreateThumbnailFromImageIfAbsent
+        let options: [CFString: Any] = [
+            fromImageKey: true,
+            kCGImageSourceCreateThumbnailWithTransform: true,
+            kCGImageSourceShouldCacheImmediately: true,
+            kCGImageSourceThumbnailMaxPixelSize: maxPixelSize,
+        ]
+        return options as CFDictionary
+    }
+}
@@ -0,0 +1,166 @@
+import Foundation
+
+/// 고정 폭 날짜 문자열을 DateFormatter 없이 직접 파싱합니다.
+///
+/// DateFormatter는 생성과 호출마다 포맷 해석 비용이 커서, 사진·트랙포인트마다
+/// 호출되는 경로에서는 숫자 필드를 바이트 단위로 읽어 계산합니다.
+enum TimestampParser {
+
+    /// EXIF 날짜 문자열을 파싱합니다.
+    ///
+    /// "yyyy:MM:dd HH:mm:ss" 또는 "yyyy-MM-dd HH:mm:ss" 형식을 지원하며, 뒤에 붙은 소수초(".SSS")는 무시합니다.
+    /// 그 밖의 문자가 뒤에 붙어 있으면 nil을 반환합니다.
+    ///
+    /// - Parameters:
+    ///   - string: EXIF 날짜 문자열
+    ///   - timeZone: 촬영 시각에 적용할 타임존 (EXIF 날짜 자체에는 오프셋이 없음)
+    /// - Returns: 파싱된 시각, 또는 형식이 맞지 않으면 nil
+    static func parseEXIF(_ string: String, timeZone: TimeZone) -> Date? {
+        var utf8 = string.utf8[...]
+        guard let fields = parseDateTime(&utf8, dateSeparators: [UInt8(ascii: ":"), UInt8(ascii: "-")]) else {
+            return nil
+        }
+
+        // 소수초는 숫자만 허용하고 버림
+        if utf8.first == UInt8(ascii: ".") {
+            utf8.removeFirst()
+            guard skipDigits(&utf8) > 0 else { return nil }
+        }
+        guard utf8.isEmpty else { return nil }
+
+        return localDate(fields, timeZone: timeZone)
+    }
+
+    /// ISO 8601 날짜 문자열을 파싱합니다 (GPX `<time>` 형식).
+    ///
+    /// "yyyy-MM-ddTHH:mm:ss[.SSS][Z|±HH:mm|±HHmm]" 형식을 지원하며, 오프셋이 없으면 UTC로 간주합니다.
+    ///
+    /// - Returns: 파싱된 시각, 또는 형식이 맞지 않으면 nil
+    static func parseISO8601(_ string: String) -> Date? {
+        var utf8 = string.utf8[...]
+        guard let fields = parseDateTime(&utf8, dateSeparators: [UInt8(ascii: "-")]) else {
+            return nil
+        }
+
+        // 소수초
+        var fraction = 0.0
+        if utf8.first == UInt8(ascii: ".") {
+            utf8.removeFirst()
+            var scale = 0.1
+            var digitCount = 0
+            while let b = utf8.first, b >= UInt8(ascii: "0"), b <= UInt8(ascii: "9") {
+                fraction += Double(b - UInt8(ascii: "0")) * scale
+                scale /= 10
+                digitCount += 1
+                utf8.removeFirst()
+            }
+            guard digitCount > 0 else { return nil }
+        }
+
+        // 타임존 오프셋
+        var offsetSeconds = 0
+        if let b = utf8.popFirst() {
+            switch b {
+            case UInt8(ascii: "Z"):
+                break
+            case UInt8(ascii: "+"), UInt8(ascii: "-"):
+                guard let hours = readDigits(&utf8, count: 2) else { return nil }
+                if utf8.first == UInt8(ascii: ":") { utf8.removeFirst() }
+                guard let minutes = readDigits(&utf8, count: 2),
+                      hours <= 14, minutes < 60 else { return nil }
+                let sign = b == UInt8(ascii: "-") ? -1 : 1
+                offsetSeconds = sign * (hours * 3600 + minutes * 60)
+            default:
+                return nil
+            }
+        }
+        guard utf8.isEmpty else { return nil }
+
+        let seconds = secondsSince1970(fields) - offsetSeconds
+        return Date(timeIntervalSince1970: TimeInterval(seconds) + fraction)
+    }
+
+    // MARK: - Private
+
+    private struct Fields {
+        let year, month, day, hour, minute, second: Int
+    }
+
+    /// "yyyy?MM?dd?HH:mm:ss" 앞부분을 읽고, 읽은 만큼 `bytes`를 전진시킵니다.
+    private static func parseDateTime(_ bytes: inout Substring.UTF8View, dateSeparators: [UInt8]) -> Fields? {
+        guard let year = readDigits(&bytes, count: 4),
+              let s1 = bytes.popFirst(), dateSeparators.contains(s1),
+              let month = readDigits(&bytes, count: 2),
+              let s2 = bytes.popFirst(), s2 == s1,
+              let day = readDigits(&bytes, count: 2),
+              let s3 = bytes.popFirst(), s3 == UInt8(ascii: " ") || s3 == UInt8(ascii: "T"),
+              let hour = readDigits(&bytes, count: 2),
+              bytes.popFirst() == UInt8(ascii: ":"),
+              let minute = readDigits(&bytes, count: 2),
+              bytes.popFirst() == UInt8(ascii: ":"),
+              let second = readDigits(&bytes, count: 2)
+        else { return nil }
+
+        guard (1...12).contains(month), (1...daysInMonth(year: year, month: month)).contains(day),
+              hour < 24, minute < 60, second < 61 else { return nil }
+
+        return Fields(year: year, month: month, day: day, hour: hour, minute: minute, second: second)
+    }
+
+    private static func readDigits(_ bytes: inout Substring.UTF8View, count: Int) -> Int? {
+        var value = 0
+        for _ in 0..<count {
+            guard let b = bytes.popFirst(), b >= UInt8(ascii: "0"), b <= UInt8(ascii: "9") else { return nil }
+            value = value * 10 + Int(b - UInt8(ascii: "0"))
+        }
+        return value
+    }
+
+    /// 연속된 숫자를 건너뛰고, 건너뛴 개수를 반환합니다.
+    private static func skipDigits(_ bytes: inout Substring.UTF8View) -> Int {
+        var count = 0
+        while let b = bytes.first, b >= UInt8(ascii: "0"), b <= UInt8(ascii: "9") {
+            bytes.removeFirst()
+            count += 1
+        }
+        return count
+    }
+
+    private static func daysInMonth(year: Int, month: Int) -> Int {
+        switch month {
+        case 2:
+            let isLeapYear = (year % 4 == 0 && year % 100 != 0) || year % 400 == 0
+            return isLeapYear ? 29 : 28
+        case 4, 6, 9, 11:
+            return 30
+        default:
+            return 31
+        }
+    }
+
+    /// 필드를 UTC 기준 1970년 이후 초로 변환합니다.
+    private static func secondsSince1970(_ f: Fields) -> Int {
+        days(year: f.year, month: f.month, day: f.day) * 86_400
+            + f.hour * 3600 + f.minute * 60 + f.second
+    }
+
+    /// 타임존의 벽시계 시각으로 해석합니다. 서머타임 경계도 해당 시점의 오프셋을 따릅니다.
+    private static func localDate(_ f: Fields, timeZone: TimeZone) -> Date {
+        let naive = TimeInterval(secondsSince1970(f))
+        let firstOffset = timeZone.secondsFromGMT(for: Date(timeIntervalSince1970: naive))
+        let guess = Date(timeIntervalSince1970: naive - TimeInterval(firstOffset))
+        let offset = timeZone.secondsFromGMT(for: guess)
+        return Date(timeIntervalSince1970: naive - TimeInterval(offset))
+    }
+
+    /// 1970-01-01 기준 일수 (proleptic Gregorian, Howard Hinnant의 days_from_civil)
+    private static func days(year: Int, month: Int, day: Int) -> Int {
+        let y = month <= 2 ? year - 1 : year
+        let era = (y >= 0 ? y : y - 399) / 400
+        let yoe = y - era * 400
+        let mp = (month + 9) % 12
+        let doy = (153 * mp + 2) / 5 + day - 1
+        let doe = yoe * 365 + yoe / 4 - yoe / 100 + doy
+        return era * 146_097 + doe - 719_468
+    }
+}
@@ -12,7 +12,7 @@ final class MainViewModel {
 
     var photos: [PhotoItem] = []
     var gpxFiles: [GPXFile] = []
-    var allTrackPoints: [GPXTrackPoint] = []
+    var timeline: GPXTimeline = .empty
 
     var selectedPhotoIDs: Set<UUID> = []
     var isProcessing = false
@@ -131,14 +131,16 @@ final class MainViewModel {
             if FileManager.default.fileExists(atPath: url.path, isDirectory: &isDir) {
                 if isDir.boolValue {
                     // 디렉토리면 안에 있는 이미지 파일들을 추가
+                    // (파일 종류는 디렉토리를 읽을 때 함께 가져와 항목마다 stat하지 않음)
                     if let enumerator = FileManager.default.enumerator(
-                        at: url, includingPropertiesForKeys: nil,
+                        at: url, includingPropertiesForKeys: [.isRegularFileKey],
                         options: [.skipsHiddenFiles, .skipsSubdirectoryDescendants]
                     ) {
                         for case let fileURL as URL in enumerator {
-                            if PhotoMetadataService.isSupported(url: fileURL) {
-                                fileURLs.append(fileURL)
-                            }
+                            guard PhotoMetadataService.isSupported(url: fileURL),
+                                  (try? fileURL.resourceValues(forKeys: [.isRegularFileKey]))?.isRegularFile == true
+                            else { continue }
+                            fileURLs.append(fileURL)
                         }
                     }
                 } else if PhotoMetadataService.isSupported(url: url) {
@@ -198,8 +200,9 @@ final class MainViewModel {
         guard !gpxURLs.isEmpty else { return }
 
         // 중복 방지
-        let existingPaths = Set(gpxFiles.map { $0.url.path })
-        let newURLs = gpxURLs.filter { !existingPaths.contains($0.path) }
+        // GPX 캐시와 같은 기준(standardizedFileURL)으로 중복을 판별
+        var seenPaths = Set(gpxFiles.map { $0.url.standardizedFileURL.path })
+        let newURLs = gpxURLs.filter { seenPaths.insert($0.standardizedFileURL.path).inserted }
         let duplicateCount = gpxURLs.count - newURLs.count
 
         if duplicateCount > 0 {
@@ -216,14 +219,13 @@ final class MainViewModel {
         isLoadingGPX = true
         let urlsToProcess = newURLs
         Task {
-            let (newFiles, _) = await Task.detached {
+            let (newFiles, newPoints) = await Task.detached {
                 GPXParser.parseFiles(urls: urlsToProcess)
             }.value
 
             self.gpxFiles.append(contentsOf: newFiles)
-            // 전체 트랙포인트 재생성
-            self.allTrackPoints = self.gpxFiles.flatMap { $0.trackPoints }
-                .sorted { $0.time < $1.time }
+            // 파싱 단계에서 정렬된 새 트랙포인트를 기존 타임라인에 병합
+            self.timeline = self.timeline.merging(newPoints)
 
             let pointCount = newFiles.reduce(0) { $0 + $1.trackPoints.count }
             self.statusMessage = String(localized: "status.gpxLoaded \(newFiles.count) \(pointCount)")
@@ -237,14 +239,14 @@ final class MainViewModel {
 
     /// 로드된 GPX와 사진을 매칭합니다.
     func runMatching() {
-        guard !allTrackPoints.isEmpty else { return }
+        guard !timeline.isEmpty else { return }
 
         let pendingPhotos = photos.filter {
             $0.status == .pending || $0.status == .noMatch || $0.status == .matched
         }
         guard !pendingPhotos.isEmpty else { return }
 
-        GeotagEngine.matchPhotos(pendingPhotos, trackPoints: allTrackPoints, maxGap: maxGapSeconds)
+        GeotagEngine.matchPhotos(pendingPhotos, timeline: timeline, maxGap: maxGapSeconds)
 
         let matched = photos.filter { $0.status == .matched }.count
         statusMessage = String(localized: "status.matchResult \(matched) \(photos.count)")
@@ -298,39 +300,37 @@ final class MainViewModel {
         statusMessage = String(localized: "status.writing \(0) \(targets.count)")
 
         // MainActor에서 필요한 데이터를 미리 추출
-        struct WriteJob: Sendable {
-            let index: Int
-            let url: URL
-            let lat: Double
-            let lon: Double
-            let alt: Double
-        }
-
-        var jobs: [WriteJob] = []
+        var jobIndices: [Int] = []
+        var writes: [PhotoMetadataService.GPSWrite] = []
         for (i, photo) in targets.enumerated() {
             guard let coord = photo.matchedCoordinate else { continue }
-            let alt = photo.matchedAltitude ?? 0
-            jobs.append(WriteJob(index: i, url: photo.url, lat: coord.latitude, lon: coord.longitude, alt: alt))
+            jobIndices.append(i)
+            writes.append(PhotoMetadataService.GPSWrite(
+                url: photo.url, coordinate: coord, altitude: photo.matchedAltitude ?? 0
+            ))
         }
 
+        let batch = writes
         let totalCount = targets.count
         Task {
-            var successCount = 0
-            for job in jobs {
-                let coord = CLLocationCoordinate2D(latitude: job.lat, longitude: job.lon)
-                let success = await Task.detached {
-                    PhotoMetadataService.writeGPS(to: job.url, coordinate: coord, altitude: job.alt)
-                }.value
+            // 백그라운드에서 병렬로 기록하고 진행 상황만 MainActor로 전달
+            let results = await PhotoMetadataService.writeGPS(batch) { done in
+                Task { @MainActor in
+                    guard self.isProcessing else { return }
+                    self.statusMessage = String(localized: "status.writing \(done) \(totalCount)")
+                }
+            }
 
-                let photo = targets[job.index]
+            var successCount = 0
+            for (k, success) in results.enumerated() {
+                let photo = targets[jobIndices[k]]
                 if success {
-                    photo.originalCoordinate = coord
+                    photo.originalCoordinate = batch[k].coordinate
                     photo.status = .written
                     successCount += 1
                 } else {
                     photo.status = .error
                 }
-                self.statusMessage = String(localized: "status.writing \(job.index + 1) \(totalCount)")
             }
 
             self.isProcessing = false
@@ -343,7 +343,7 @@ final class MainViewModel {
     func clearAll() {
         photos.removeAll()
         gpxFiles.removeAll()
-        allTrackPoints.removeAll()
+        timeline = .empty
         selectedPhotoIDs.removeAll()
         manualCoordinate = nil
         statusMessage = String(localized: "status.ready")
@@ -351,17 +351,30 @@ final class MainViewModel {
 
     // MARK: - Private
 
-    private func loadMetadata(for items: [PhotoItem]) async {
-        for photo in items {
-            let metadata = PhotoMetadataService.readMetadata(from: photo.url)
-            photo.dateTaken = metadata.dateTaken
-            photo.originalCoordinate = metadata.coordinate
+    /// 메타데이터를 읽어 한 번에 반영하는 사진 묶음 크기
+    private static let metadataChunkSize = 200
 
-            if metadata.hasGPS {
-                photo.status = .hasGPS
+    private func loadMetadata(for items: [PhotoItem]) async {
+        // 묶음 단위로 백그라운드에서 병렬로 읽고, 읽은 묶음은 바로 MainActor에서 반영
+        for start in stride(from: 0, to: items.count, by: Self.metadataChunkSize) {
+            let chunk = items[start..<min(start + Self.metadataChunkSize, items.count)]
+            let urls = chunk.map { $0.url }
+            let results = await PhotoMetadataService.readMetadata(from: urls)
+
+            for (photo, metadata) in zip(chunk, results) {
+                apply(metadata, to: photo)
             }
         }
     }
+
+    private func apply(_ metadata: PhotoMetadataService.Metadata, to photo: PhotoItem) {
+        photo.dateTaken = metadata.dateTaken
+        photo.originalCoordinate = metadata.coordinate
+
+        if metadata.hasGPS {
+            photo.status = .hasGPS
+        }
+    }
 }
 
 // MARK: - UTType extension
@@ -118,7 +118,7 @@ struct ContentView: View {
                     .labelStyle(.titleAndIcon)
             }
             .help(Text("toolbar.runMatching.help"))
-            .disabled(viewModel.allTrackPoints.isEmpty || viewModel.photos.isEmpty)
+            .disabled(viewModel.timeline.isEmpty || viewModel.photos.isEmpty)
 
             Button {
                 viewModel.writeAllMatched()
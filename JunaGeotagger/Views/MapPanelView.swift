@@ -1,6 +1,5 @@
 import SwiftUI
 import MapKit
-import QuickLookThumbnailing
 import UniformTypeIdentifiers
 
 /// 지도 패널 — GPX 트랙, 사진 위치 표시, 드래그 앤 드롭 위치 지정
@@ -44,7 +43,7 @@ struct MapPanelView: View {
                 // GPX 트랙 라인
                 ForEach(viewModel.gpxFiles) { file in
                     ForEach(Array(file.segments.enumerated()), id: \.offset) { _, segment in
-                        MapPolyline(coordinates: segment.points)
+                        MapPolyline(coordinates: segment.displayPoints)
                             .stroke(.orange, lineWidth: 3)
                     }
                 }
@@ -302,14 +301,8 @@ struct PhotoMapPopover: View {
     }
 
     private func loadThumbnail() async {
-        let request = QLThumbnailGenerator.Request(
-            fileAt: photo.url,
-            size: CGSize(width: 120, height: 120),
-            scale: 2,
-            representationTypes: .thumbnail
-        )
-        if let rep = try? await QLThumbnailGenerator.shared.generateBestRepresentation(for: request) {
-            thumbnail = rep.nsImage
+        if let image = await ThumbnailService.thumbnail(for: photo.url, size: 120) {
+            thumbnail = image
         }
     }
 }
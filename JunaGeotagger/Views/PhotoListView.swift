@@ -1,5 +1,4 @@
 import SwiftUI
-import QuickLookThumbnailing
 
 /// 사진 목록 사이드바 뷰
 struct PhotoListView: View {
@@ -136,18 +135,8 @@ struct PhotoRowView: View {
     }
 
     private func loadThumbnail() async {
-        let request = QLThumbnailGenerator.Request(
-            fileAt: photo.url,
-            size: CGSize(width: 96, height: 96),
-            scale: 2,
-            representationTypes: .thumbnail
-        )
-        do {
-            let representation = try await QLThumbnailGenerator.shared.generateBestRepresentation(for: request)
-            self.thumbnail = representation.nsImage
-        } catch {
-            // 썸네일 생성 실패 — 무시
-        }
+        // 썸네일 생성 실패 시 nil — 자리표시자 유지
+        thumbnail = await ThumbnailService.thumbnail(for: photo.url, size: 96)
     }
 
     @ViewBuilder